@@ -6,8 +6,8 @@ from typing import Set
 import matplotlib.pyplot as plt
 
 from convex_hull import Point
-from convex_hull import base_case_hull
 from convex_hull import compute_hull
+from convex_hull import jarvis_march
 
 
 def generate_points(
@@ -51,7 +51,7 @@ def run_benchmarks():
         dnc_hull_times.append(time_taken)
 
         start_time = time.time()
-        base_case_hull(points)
+        jarvis_march(points)
         time_taken = time.time() - start_time  # time taken (in seconds) for naive
 
         print(f'naive_time_taken: {time_taken:.3f}')
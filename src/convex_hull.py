@@ -1,22 +1,42 @@
 import math
-import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from typing import List
+from typing import Optional
 from typing import Tuple
 
-EPSILON = sys.float_info.epsilon
 Point = Tuple[int, int]
 
+# When asked to use several workers, compute_hull only splits inputs larger
+# than this across processes. Below it, starting the processes costs more
+# than it saves.
+PARALLEL_THRESHOLD = 50_000
 
-def y_intercept(p1: Point, p2: Point, x: int) -> float:
+# The base case of compute_hull handles runs of this many points.
+# The monotone chain is linear on sorted points, so at this size it is
+# cheaper than splitting and merging any further.
+BASE_CASE_SIZE = 32
+
+
+def orient(ax: int, ay: int, bx: int, by: int, cx: int, cy: int) -> int:
     """
-    Given two points, p1 and p2, an x coordinate from a vertical line,
-    compute and return the the y-intercept of the line segment p1->p2
-    with the vertical line passing through x.
+    Given the coordinates of three points a,b,c,
+    computes and returns twice the area defined by the triangle a,b,c.
+    Like triangle_area, this is negative if a,b,c represents a clockwise sequence,
+    positive if it is counter-clockwise,
+    and zero if the points are collinear.
+    For integer coordinates the result is exact, so its sign can be tested
+    directly, with no floating-point tolerance.
     """
-    x1, y1 = p1
-    x2, y2 = p2
-    slope = (y2 - y1) / (x2 - x1)
-    return y1 + (x - x1) * slope
+    return (cx - bx) * (by - ay) - (bx - ax) * (cy - by)
+
+
+def _orient(xs: List[int], ys: List[int], a: int, b: int, c: int) -> int:
+    """
+    orient for the points at indices a,b,c of the coordinate lists xs, ys.
+    """
+    return (xs[c] - xs[b]) * (ys[b] - ys[a]) - (xs[b] - xs[a]) * (ys[c] - ys[b])
 
 
 def triangle_area(a: Point, b: Point, c: Point) -> float:
@@ -27,37 +47,31 @@ def triangle_area(a: Point, b: Point, c: Point) -> float:
     positive if it is counter-clockwise,
     and zero if the points are collinear.
     """
-    ax, ay = a
-    bx, by = b
-    cx, cy = c
-    return ((cx - bx) * (by - ay) - (bx - ax) * (cy - by)) / 2
+    return orient(*a, *b, *c) / 2
 
 
 def is_clockwise(a: Point, b: Point, c: Point) -> bool:
     """
     Given three points a,b,c,
     returns True if and only if a,b,c represents a clockwise sequence
-    (subject to floating-point precision)
     """
-    return triangle_area(a, b, c) < -EPSILON
+    return orient(*a, *b, *c) < 0
 
 
 def is_counter_clockwise(a: Point, b: Point, c: Point) -> bool:
     """
     Given three points a,b,c,
     returns True if and only if a,b,c represents a counter-clockwise sequence
-    (subject to floating-point precision)
     """
-    return triangle_area(a, b, c) > EPSILON
+    return orient(*a, *b, *c) > 0
 
 
 def collinear(a: Point, b: Point, c: Point) -> bool:
     """
     Given three points a,b,c,
     returns True if and only if a,b,c are collinear
-    (subject to floating-point precision)
     """
-    return abs(triangle_area(a, b, c)) <= EPSILON
+    return orient(*a, *b, *c) == 0
 
 
 def sort_clockwise(points: List[Point]):
@@ -77,46 +91,116 @@ def sort_clockwise(points: List[Point]):
     centroid_x = sum(p[0] for p in points) / len(points)
     centroid_y = sum(p[1] for p in points) / len(points)
 
-    # Sort by ascending clockwise angle from +x, breaking ties with ^x then ^y
-    def sort_key(point: Point):
-        angle = math.atan2(point[1] - centroid_y, point[0] - centroid_x)
+    # Sort by ascending clockwise angle from +x, breaking ties with ^x then ^y.
+    # The keys are computed up front in one loop over local variables,
+    # rather than by calling a key function for every point.
+    keys = []
+    for x, y in points:
+        angle = math.atan2(y - centroid_y, x - centroid_x)
         normalized_angle = (angle + math.tau) % math.tau
-        return (normalized_angle, point[0], point[1])
+        keys.append((normalized_angle, x, y))
 
     # Sort the points
-    points.sort(key=sort_key)
+    order = sorted(range(len(points)), key=keys.__getitem__)
+    points[:] = [points[i] for i in order]
 
 
 def base_case_hull(points: List[Point]) -> List[Point]:
     """
-    Base case of the recursive algorithm.
+    Base case of the divide and conquer algorithm.
+
+    The hull is returned in clockwise order (the same order sort_clockwise
+    produces), starting from the point with the lowest x value, breaking
+    ties by lowest y value. merge_hulls relies on this order.
+    """
+
+    points = _sorted_points(points)
+    xs, ys = _split_coordinates(points)
+    return [points[i] for i in _base_case_hull(xs, ys, 0, len(points))]
+
+
+def _base_case_hull(xs: List[int], ys: List[int], lo: int, hi: int) -> List[int]:
+    """
+    base_case_hull for the points at indices lo..hi-1 of xs, ys,
+    which must be sorted and free of duplicates.
+    Returns the indices of the hull points, in the same order.
     """
 
-    if len(points) <= 3:
-        return points
+    if hi - lo <= 2:
+        return list(range(lo, hi))
+
+    # Andrew's monotone chain: since the points are already sorted, one pass
+    # from left to right builds the lower half of the hull (by y value) and one
+    # pass back from right to left builds the upper half.
+    # A point is dropped as soon as it fails to make a clockwise turn, so
+    # collinear points never end up on the hull.
+    lower = []
+    for i in range(lo, hi):
+        while len(lower) >= 2 and _orient(xs, ys, lower[-2], lower[-1], i) >= 0:
+            lower.pop()
+        lower.append(i)
+
+    upper = []
+    for i in range(hi - 1, lo - 1, -1):
+        while len(upper) >= 2 and _orient(xs, ys, upper[-2], upper[-1], i) >= 0:
+            upper.pop()
+        upper.append(i)
+
+    # Each half ends where the other one starts.
+    return lower[:-1] + upper[:-1]
+
+
+def jarvis_march(points: List[Point]) -> List[Point]:
+    """
+    Computes the convex hull of `points` by gift wrapping (Jarvis march),
+    in O(nh) time for n points and h hull points.
+    This is the naive algorithm compute_hull is benchmarked against.
+
+    The hull is returned in the same order as base_case_hull.
+    """
 
-    # Sort the points by ascending x value, breaking ties by ascending y value.
-    points.sort()
+    # Duplicates would make the collinear tie-break below ambiguous.
+    points = list(set(points))
+
+    if len(points) <= 2:
+        return sorted(points)
+
+    # Start from the point with the lowest x value (ties broken by lowest y),
+    # which is always on the hull. This is a single scan, so we don't need to
+    # sort the input.
+    n = len(points)
+    start = min(range(n), key=points.__getitem__)
 
     # Initialize the convex hull.
     hull = []
 
     # Initialize our control variables.
-    p = 0
+    p = start
     q = None
 
     # Iterate through the points to find the convex hull.
     while True:
         hull.append(points[p])
-        q = (p + 1) % len(points)
-
-        for i in range(len(points)):
-            if is_counter_clockwise(points[p], points[i], points[q]):
+        q = (p + 1) % n
+
+        # Same test as is_clockwise(points[p], points[i], points[q]), that is
+        # orient(...) < 0, but inlined so there is no helper call per point.
+        # If i is collinear with p and q, we keep whichever of the two is
+        # farther from p, so collinear points never end up on the hull.
+        px, py = points[p]
+        qx, qy = points[q]
+        for i, (ix, iy) in enumerate(points):
+            if i == p:
+                continue
+            turn = (qx - ix) * (iy - py) - (ix - px) * (qy - iy)
+            if turn < 0 or (turn == 0 and
+                            (ix - px) ** 2 + (iy - py) ** 2 > (qx - px) ** 2 + (qy - py) ** 2):
                 q = i
+                qx, qy = ix, iy
 
         p = q
 
-        if p == 0:
+        if p == start:
             break
     
     return hull
@@ -126,143 +210,258 @@ def merge_hulls(L: List[Point], R: List[Point]) -> List[Point]:
     """
     Given two lists of points, L and R, each of which represents a convex hull,
     computes and returns the convex hull of the combined points in L and R.
+
+    Every point in L must come before every point in R (by ascending x value,
+    breaking ties by ascending y value), and both hulls must be in the order
+    base_case_hull returns. The result is in that same order, so merged hulls
+    can be merged again without re-sorting them.
     """
 
-    # Sort the points in L and R by ascending x value, breaking ties by ascending y value.
-    sort_clockwise(L)
-    sort_clockwise(R)
-    
-    # Print the hulls for debugging purposes.
-    #print("L:", L)
-    #print("R:", R)
+    points = _sorted_points(L + R)
+    xs, ys = _split_coordinates(points)
+    index = {point: i for i, point in enumerate(points)}
+    result = _merge_hulls(xs, ys, [index[p] for p in L], [index[p] for p in R])
+    return [points[i] for i in result]
 
-    # Initialize the convex hull.
-    result = []
 
-    # Initialize our control variables.
-    right_of_left_idx = L.index(max(L, key=lambda p: p[0]))
-    left_of_right_idx = R.index(min(R, key=lambda p: p[0]))
+def _merge_hulls(xs: List[int], ys: List[int], L: List[int], R: List[int]) -> List[int]:
+    """
+    merge_hulls for two hulls given as lists of indices into xs, ys.
+    Indices must follow the sorted order of the points, so that comparing
+    two indices compares the points they refer to.
+    """
 
-    # Print the indices for debugging purposes.
-    #print("Right of left:", right_of_left_idx)
-    #print("Left of right:", left_of_right_idx)
+    # Initialize our control variables.
+    # Indices follow the sorted order of the points, so these pick the rightmost
+    # point of L and the leftmost point of R (ties broken by y) in a single pass each.
+    right_of_left_idx = max(range(len(L)), key=L.__getitem__)
+    left_of_right_idx = min(range(len(R)), key=R.__getitem__)
 
     # Initialize the upper tangent.
-    upper_tangent = (right_of_left_idx, left_of_right_idx)
+    # The tangent is tracked as its two indices, (upper_left, upper_right),
+    # rather than as a tuple that has to be rebuilt on every step.
+    upper_left = right_of_left_idx
+    upper_right = left_of_right_idx
 
     # Find the upper tangent.
-    # The upper tangent is an invariant as it remains a valid tuple 
+    # Each side is walked as far as it will go in one _walk_tangent call,
+    # while the other side stays fixed; we stop once neither side moves.
+    # The upper tangent is an invariant as it remains a valid pair of indices
     # (Left Point, Right Point) within the bounds.
     while True:
-        right_progress = False
-        left_progress = False
-        
-        while True:
-            next_right = (upper_tangent[1] + 1) % len(R)
-
-            if is_counter_clockwise(L[upper_tangent[0]], R[upper_tangent[1]], R[next_right]):
-                upper_tangent = (upper_tangent[0], next_right)
-                right_progress = True
-            else:
-                break
-            
-        while True:
-            next_left = (upper_tangent[0] - 1) % len(L)
-
-            if is_clockwise(R[upper_tangent[1]], L[upper_tangent[0]], L[next_left]):
-                upper_tangent = (next_left, upper_tangent[1])
-                left_progress = True
-            else:
-                break
-        
-        # Check if the 
+        next_right = _walk_tangent(xs, ys, L[upper_left], R, upper_right, 1)
+        next_left = _walk_tangent(xs, ys, R[next_right], L, upper_left, -1)
+
+        right_progress = next_right != upper_right
+        left_progress = next_left != upper_left
+        upper_left, upper_right = next_left, next_right
+
         if not right_progress and not left_progress:
             break
-        
-    #print("Upper tangent:", upper_tangent)
 
     # Initialize the lower tangent.
-    lower_tangent = (right_of_left_idx, left_of_right_idx)
+    lower_left = right_of_left_idx
+    lower_right = left_of_right_idx
 
     # Find the lower tangent.
-    # The lower tangent is an invariant as it remains a valid tuple
+    # The lower tangent is an invariant as it remains a valid pair of indices
     # (Left Point, Right Point) within the bounds.
     while True:
-        right_progress = False
-        left_progress = False
-        
-        while True:
-            next_right = (lower_tangent[1] - 1) % len(R)
-
-            if is_clockwise(L[lower_tangent[0]], R[lower_tangent[1]], R[next_right]):
-                lower_tangent = (lower_tangent[0], next_right)
-                right_progress = True
-            else:
-                break
-            
-        while True:
-            next_left = (lower_tangent[0] + 1) % len(L)
-
-            if is_counter_clockwise(R[lower_tangent[1]], L[lower_tangent[0]], L[next_left]):
-                lower_tangent = (next_left, lower_tangent[1])
-                left_progress = True
-            else:
-                break
-            
+        next_right = _walk_tangent(xs, ys, L[lower_left], R, lower_right, -1)
+        next_left = _walk_tangent(xs, ys, R[next_right], L, lower_left, 1)
+
+        right_progress = next_right != lower_right
+        left_progress = next_left != lower_left
+        lower_left, lower_right = next_left, next_right
+
         if not right_progress and not left_progress:
             break
-    
-    #print("Lower tangent:", lower_tangent)
-
-    # Merge Left
-    for i in range(lower_tangent[0], upper_tangent[0] + 1):
-        result.append(L[i])
-        
-    # Merge Right
-    if lower_tangent[1] > upper_tangent[1]:
-        for i in range(upper_tangent[1], lower_tangent[1] + 1):
-            result.append(R[i])
+
+    # Merge Left, from the first point of L up to the upper tangent.
+    result = L[:upper_left + 1]
+
+    # Merge Right, from the upper tangent round to the lower tangent.
+    if upper_right <= lower_right:
+        result += R[upper_right:lower_right + 1]
     else:
-        for i in range(upper_tangent[1], len(R)):
-            result.append(R[i])
-        for i in range(0, lower_tangent[1] + 1):
-            result.append(R[i])
+        result += R[upper_right:]
+        result += R[:lower_right + 1]
 
-    #print("Result:", result)
-    #print()
+    # Merge the rest of Left, from the lower tangent back round to the start.
+    # If the lower tangent wrapped back to the start (or meets the upper
+    # tangent) there is nothing left to add.
+    if lower_left > upper_left:
+        result += L[lower_left:]
 
     return result
 
 
-def compute_hull(points: List[Point]) -> List[Point]:
+def compute_hull(points: List[Point], workers: Optional[int] = 1) -> List[Point]:
     """
     Given a list of points, computes the convex hull around those points
     and returns only the points that are on the hull.
+
+    By default everything runs in this process. With `workers` > 1, inputs
+    larger than PARALLEL_THRESHOLD are split across that many processes;
+    `workers=None` uses every CPU this process may run on.
     """
-    
-    # Sort the points by ascending x value, breaking ties by ascending y value.
-    #points = list(set(points))
-    #print("Points:", points)
-    
-    # The list of points remain in ascending x-value order displaying the invariant 
-    # property of the list
-    points.sort()
-    #print("Points:", points)
-
-    # Base case: if there are 5 or fewer points, we call the base case function.
-    # This invariant property remains constant troughout the program as it is only 
-    # called when the length of the list of points is less than or equal to 5.
-    if len(points) <= 5:
-        return base_case_hull(points)
-    
-    # Split the points into two halves (L & R).
-    middle = len(points) // 2
-    L = points[:middle]
-    R = points[middle:]
 
-    # Recursively compute the hulls of the two halves.
-    L = compute_hull(L)
-    R = compute_hull(R)
+    # Remove duplicate points and sort by ascending x value, breaking ties by
+    # ascending y value. This is done once here rather than at every level of
+    # the divide and conquer, since a range of a sorted list is still sorted.
+    points = _sorted_points(points)
+
+    # The divide and conquer works on the x and y coordinates as two separate lists,
+    # and represents each hull by the indices of its points. Merging hulls then
+    # only moves integers around, and we only build the hull's points at the end.
+    xs, ys = _split_coordinates(points)
+    if workers is None:
+        workers = _available_cpus()
+    if len(points) > PARALLEL_THRESHOLD and workers > 1:
+        hull = _compute_hull_parallel(xs, ys, workers)
+    else:
+        hull = _compute_hull_sorted(xs, ys, 0, len(points))
+    return [points[i] for i in hull]
+
+
+def _available_cpus() -> int:
+    """
+    Returns the number of CPUs this process may run on.
+    Unlike os.cpu_count(), this respects CPU affinity where the platform
+    supports it, so a process pinned to one CPU of a large host gets 1.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _compute_hull_parallel(xs: List[int], ys: List[int], workers: int) -> List[int]:
+    """
+    compute_hull for large inputs: splits the points into `workers` contiguous
+    chunks, computes the hull of each chunk in its own process, then merges
+    the chunk hulls in pairs.
+    """
+
+    # Hulls of separate runs of points are independent, so the chunks can be
+    # computed in parallel. Each process only receives its own chunk.
+    n = len(xs)
+    bounds = [n * i // workers for i in range(workers + 1)]
+    chunks = zip(bounds, bounds[1:])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_compute_chunk_hull, xs[lo:hi], ys[lo:hi], lo)
+            for lo, hi in chunks
+        ]
+        hulls = [future.result() for future in futures]
+
+    return _merge_all(xs, ys, hulls)
+
+
+def _compute_chunk_hull(xs: List[int], ys: List[int], offset: int) -> List[int]:
+    """
+    Worker for _compute_hull_parallel: computes the hull of one chunk and
+    returns its indices shifted by `offset`, so they index the full lists.
+    """
+    return [offset + i for i in _compute_hull_sorted(xs, ys, 0, len(xs))]
+
+
+def _compute_hull_sorted(xs: List[int], ys: List[int], lo: int, hi: int) -> List[int]:
+    """
+    Divide and conquer part of compute_hull, for the points at indices lo..hi-1
+    of xs, ys. The points must be free of duplicates and sorted by ascending
+    x value, breaking ties by ascending y value.
+
+    Rather than recursing, this works bottom-up: it computes the hull of every
+    run of BASE_CASE_SIZE consecutive points, then merges neighbouring hulls
+    until one is left. Like the recursion, every merge joins the hulls of two
+    neighbouring ranges, but there is no Python call frame per split and no
+    recursion limit to hit on large inputs.
+    """
+
+    # Base case: the points are in ascending x-value order, so each run of
+    # BASE_CASE_SIZE or fewer consecutive points is itself sorted, and
+    # _base_case_hull is only ever called with that many points.
+    hulls = [
+        _base_case_hull(xs, ys, i, min(i + BASE_CASE_SIZE, hi))
+        for i in range(lo, hi, BASE_CASE_SIZE)
+    ]
+    return _merge_all(xs, ys, hulls)
+
 
-    # Merge the two hulls together.
-    return merge_hulls(L, R)
+def _merge_all(xs: List[int], ys: List[int], hulls: List[List[int]]) -> List[int]:
+    """
+    Merges a list of hulls of neighbouring runs of points, given in ascending
+    order, into the single hull of all of their points.
+    """
+
+    if not hulls:
+        return []
+
+    # Merge neighbouring hulls in pairs until only one is left.
+    # An odd hull out is carried over to the next round unchanged.
+    while len(hulls) > 1:
+        hulls = [
+            _merge_hulls(xs, ys, hulls[i], hulls[i + 1]) if i + 1 < len(hulls) else hulls[i]
+            for i in range(0, len(hulls), 2)
+        ]
+    return hulls[0]
+
+
+def _walk_tangent(xs: List[int], ys: List[int], a: int, hull: List[int], i: int, step: int) -> int:
+    """
+    Walks one side of a tangent for _merge_hulls.
+
+    Starting from hull[i], steps through `hull` by `step` (1 or -1, wrapping
+    around) for as long as the next point turns the tangent from the point at
+    index a further out: orient(a, current, next) has the same sign as `step`.
+    When the next point is collinear with the tangent, we still move to it if
+    it is farther from a, so the tangent ends on the extreme points (hulls of
+    collinear points rely on this).
+    Returns the position in `hull` where the walk stops.
+    """
+
+    # This is the orientation test, the distance tie-break and the index
+    # update fused into one loop: the fixed point's coordinates are read once,
+    # and each step only reads the coordinates of the next point.
+    n = len(hull)
+    ax, ay = xs[a], ys[a]
+    b = hull[i]
+    bx, by = xs[b], ys[b]
+    while True:
+        j = i + step
+        if j == n:
+            j = 0
+        elif j < 0:
+            j = n - 1
+
+        c = hull[j]
+        cx, cy = xs[c], ys[c]
+        turn = ((cx - bx) * (by - ay) - (bx - ax) * (cy - by)) * step
+
+        if turn > 0 or (turn == 0 and
+                        (cx - ax) ** 2 + (cy - ay) ** 2 > (bx - ax) ** 2 + (by - ay) ** 2):
+            i = j
+            bx, by = cx, cy
+        else:
+            return i
+
+
+def _sorted_points(points: List[Point]) -> List[Point]:
+    """
+    Returns the distinct points of `points`, sorted by ascending x value,
+    breaking ties by ascending y value.
+    """
+
+    # Two stable sorts on a single int each (y first, then x) give the same
+    # order as sorting the tuples, but every comparison is between two ints
+    # rather than two tuples, which is noticeably faster for large inputs.
+    points = sorted(set(points), key=itemgetter(1))
+    points.sort(key=itemgetter(0))
+    return points
+
+
+def _split_coordinates(points: List[Point]) -> Tuple[List[int], List[int]]:
+    """
+    Splits `points` into a list of x coordinates and a list of y coordinates.
+    """
+    return [p[0] for p in points], [p[1] for p in points]
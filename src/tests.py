@@ -6,25 +6,20 @@ from hypothesis import given
 from hypothesis import strategies as st
 
 from convex_hull import Point
-from convex_hull import clockwise_sort
+from convex_hull import _compute_hull_parallel
+from convex_hull import _compute_hull_sorted
+from convex_hull import _sorted_points
+from convex_hull import _split_coordinates
+from convex_hull import base_case_hull
+from convex_hull import sort_clockwise as clockwise_sort
 from convex_hull import compute_hull
 from convex_hull import is_clockwise
 from convex_hull import is_counter_clockwise
-from convex_hull import y_intercept
 
 
 class TestGivenFunctions(unittest.TestCase):
     """ This class checks simple cases for the given functions.
     """
-    def test_y_intercept(self):
-        p1 = (0, 0)
-        p2 = (20, 40)
-        xs = [i for i in range(41)]
-        for x in xs:
-            y_int = y_intercept(p1, p2, x)
-            self.assertAlmostEqual(2 * x, y_int, places=5)
-        return
-
     def test_clockwise(self):
         p1 = (0, 0)
         p2 = (1, 0)
@@ -59,6 +54,17 @@ class TestGivenFunctions(unittest.TestCase):
             self.assertTrue(is_clockwise(a, b, c))
         return
 
+    def test_base_case_hull_order(self):
+        p1 = (0, 0)
+        p2 = (2, 0)
+        p3 = (2, 2)
+        p4 = (0, 2)
+        p5 = (1, 1)
+        hull = base_case_hull([p3, p5, p2, p4, p1])
+
+        self.assertEqual(hull, [p1, p2, p3, p4])
+        return
+
 
 def is_convex_hull(hull: List[Point], points: List[Point]):
     vertices = hull + [hull[0]]
@@ -93,3 +99,18 @@ class TestComputeHull(unittest.TestCase):
         hull = compute_hull(points)
         self.assertTrue(is_convex_hull(hull, points))
         return
+
+    def test_compute_hull_collinear(self):
+        points = [(0, y) for y in range(100)]
+
+        hull = compute_hull(points)
+        self.assertEqual(hull, [(0, 0), (0, 99)])
+        return
+
+    def test_compute_hull_parallel(self):
+        points = _sorted_points([(x * 7 % 101, x * 13 % 97) for x in range(500)])
+        xs, ys = _split_coordinates(points)
+
+        hull = _compute_hull_parallel(xs, ys, workers=2)
+        self.assertEqual(hull, _compute_hull_sorted(xs, ys, 0, len(points)))
+        return